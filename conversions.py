@@ -1,48 +1,148 @@
 import math
 from math import floor
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+def _floor_scaled(values, multiplier):
+    """
+    Multiplies every value of an array by a conversion constant and floors the result, as the scalar converters do.
+    :param values: An array like of values to convert
+    :param multiplier: The conversion constant to scale the values by
+    :return: A NumPy int64 array of the converted values
+    """
+    if np is None:
+        raise ImportError('NumPy is required for array conversions. Install it with pip install numpy')
+    scaled = np.multiply(values, multiplier, out=np.empty(np.shape(values)))
+    np.floor(scaled, out=scaled)
+    return scaled.astype(np.int64)
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _floor_scaled_kernel(values, multiplier, out):
+        for i in prange(values.shape[0]):
+            out[i] = math.floor(values[i] * multiplier)
+
+
+def _floor_scaled_parallel(values, multiplier):
+    """
+    Multiplies every value of an array by a conversion constant and floors the result, spreading the work over all
+    cores with Numba. Falls back to the single threaded NumPy conversion when Numba is not installed.
+    :param values: An array like of values to convert
+    :param multiplier: The conversion constant to scale the values by
+    :return: A NumPy int64 array of the converted values
+    """
+    if njit is None:
+        return _floor_scaled(values, multiplier)
+    values = np.asarray(values, dtype=np.float64, order='C')
+    converted = np.empty(values.shape, dtype=np.int64)
+    _floor_scaled_kernel(values.reshape(-1), multiplier, converted.reshape(-1))
+    return converted
+
 
 class PySimplexConverter:
 
+    __slots__ = ('gear_multiplier', 'wheel_size', '_smu_to_deg_k', '_deg_to_smu_k', '_speed_to_smu_k',
+                 '_smu_to_speed_k', '_acc_to_smu_k', '_smu_to_acc_k', '_meters_to_steps_k', '_steps_to_meters_k')
+
     def __init__(self, gear_multiplier, **kwargs):
-        assert isinstance(gear_multiplier, int)
+        """
+        Initializes a converter for a motor with the given gearing. Construction is validated and is not meant to be a
+        hot path, see unchecked for building converters without validation.
+        :param gear_multiplier: The integer gear ratio between the motor and the output shaft.
+        :param kwargs: wheel_size, the radius in meters of the wheel driven by the motor, used for distance conversions.
+        :raises TypeError: If the gear multiplier is not an int
+        """
+        if type(gear_multiplier) is not int:
+            raise TypeError('gear_multiplier must be an int, not {}'.format(type(gear_multiplier).__name__))
+        self._configure(gear_multiplier, kwargs)
+
+    @classmethod
+    def unchecked(cls, gear_multiplier, **kwargs):
+        """
+        Builds a converter without validating its arguments, for callers that already guarantee their types.
+        :param gear_multiplier: The integer gear ratio between the motor and the output shaft.
+        :param kwargs: wheel_size, the radius in meters of the wheel driven by the motor, used for distance conversions.
+        :return: A new PySimplexConverter
+        """
+        converter = cls.__new__(cls)
+        converter._configure(gear_multiplier, kwargs)
+        return converter
+
+    def _configure(self, gear_multiplier, kwargs):
         self.gear_multiplier = gear_multiplier
+        # Constants are kept as plain floats, so NumPy scalar, Fraction or Decimal inputs convert like any float
+        self._smu_to_deg_k = float(360 / (4096 * gear_multiplier))
+        self._deg_to_smu_k = float(4096 * gear_multiplier / 360)
+        self._speed_to_smu_k = float(256 * gear_multiplier / 60)
+        self._smu_to_speed_k = float(60 / (256 * gear_multiplier))
+        self._acc_to_smu_k = float(gear_multiplier / 3.75)
+        self._smu_to_acc_k = float(3.75 / gear_multiplier)
         if len(kwargs.items()) > 0:
             self.wheel_size = kwargs.get("wheel_size", 1)
+            wheel_size = float(self.wheel_size)
+            self._meters_to_steps_k = 4096 * gear_multiplier / (wheel_size * math.pi * 2)
+            self._steps_to_meters_k = wheel_size * math.pi * 2 / (4096 * gear_multiplier)
 
     def convert_smunits_to_degrees(self, steps):
-        percentage_of_steps = steps / 4096 / self.gear_multiplier
-        degrees = percentage_of_steps * 360
-        return int(floor(degrees))
+        return floor(steps * self._smu_to_deg_k)
+
+    def convert_smunits_to_degrees_array(self, steps):
+        return _floor_scaled(steps, self._smu_to_deg_k)
 
     def convert_degrees_to_smunits(self, degrees):
-        percentage_of_movement = degrees / 360
-        steps = percentage_of_movement * 4096 * self.gear_multiplier
-        return int(floor(steps))
+        return floor(degrees * self._deg_to_smu_k)
+
+    def convert_degrees_to_smunits_array(self, degrees):
+        return _floor_scaled(degrees, self._deg_to_smu_k)
+
+    def convert_degrees_to_smunits_bulk(self, degrees):
+        return _floor_scaled_parallel(degrees, self._deg_to_smu_k)
 
     def convert_speed_to_smunits(self, speed):
-        steps_per_second = speed / 60 * 256 * self.gear_multiplier
-        return int(floor(steps_per_second))
+        return floor(speed * self._speed_to_smu_k)
+
+    def convert_speed_to_smunits_array(self, speed):
+        return _floor_scaled(speed, self._speed_to_smu_k)
 
     def convert_smunits_to_speed(self, steps):
-        rpm = 60 * steps / 256 / self.gear_multiplier
-        return int(floor(rpm))
+        return floor(steps * self._smu_to_speed_k)
+
+    def convert_smunits_to_speed_array(self, steps):
+        return _floor_scaled(steps, self._smu_to_speed_k)
 
     def convert_acceleration_to_smunits(self, acceleration):
-        steps_per_second_squared = acceleration / 3.75 * self.gear_multiplier
-        return int(floor(steps_per_second_squared))
+        return floor(acceleration * self._acc_to_smu_k)
+
+    def convert_acceleration_to_smunits_array(self, acceleration):
+        return _floor_scaled(acceleration, self._acc_to_smu_k)
 
     def convert_smunits_to_acceleration(self, steps):
-        rpm_per_second = steps * 3.75 / self.gear_multiplier
-        return int(floor(rpm_per_second))
+        return floor(steps * self._smu_to_acc_k)
+
+    def convert_smunits_to_acceleration_array(self, steps):
+        return _floor_scaled(steps, self._smu_to_acc_k)
 
     def convert_meters_to_steps(self, meters):
-        distance_per_rotation_of_wheel = self.wheel_size * math.pi * 2
-        meters_as_rotation_multiplier = meters / distance_per_rotation_of_wheel
-        steps = meters_as_rotation_multiplier * 4096 * self.gear_multiplier
-        return int(floor(steps))
+        return floor(meters * self._meters_to_steps_k)
+
+    def convert_meters_to_steps_array(self, meters):
+        return _floor_scaled(meters, self._meters_to_steps_k)
+
+    def convert_meters_to_steps_bulk(self, meters):
+        return _floor_scaled_parallel(meters, self._meters_to_steps_k)
 
     def convert_steps_to_meters(self, steps):
-        steps_as_multiplier = steps / 4096 / self.gear_multiplier
-        distance = 2 * math.pi * self.wheel_size * steps_as_multiplier
-        return int(floor(distance))
+        return floor(steps * self._steps_to_meters_k)
+
+    def convert_steps_to_meters_array(self, steps):
+        return _floor_scaled(steps, self._steps_to_meters_k)
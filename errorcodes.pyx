@@ -0,0 +1,51 @@
+# Compiled accelerator for decoding the motor error register. Build it in place with cythonize -i errorcodes.pyx,
+# pysimplexmotor falls back to the ERROR_MESSAGES table when it is not built. Keep both in sync.
+
+
+cpdef str decode_error(int code):
+    """
+    Describes a code reported in the motor error register
+    :param code: The value of the error register
+    :return: A description of the error
+    """
+    if code == 0:
+        return "No error"
+    elif code == 1:
+        return "General internal error"
+    elif code == 2:
+        return "Internal software timing error"
+    elif code == 3:
+        return "Error in application: code not terminating"
+    elif code == 4097:
+        return "General communication error"
+    elif code == 4098:
+        return "Invalid register error"
+    elif code == 4353:
+        return "Modbus parity error"
+    elif code == 4354:
+        return "Modbus framing error"
+    elif code == 4355:
+        return "Modbus overrun error"
+    elif code == 4356:
+        return "Modbus checksum error"
+    elif code == 4357:
+        return "Modbus illegal function code error"
+    elif code == 4358:
+        return "Modbus illegal diagnostics function code error"
+    elif code == 8193:
+        return "Hardware overcurrent protection triggered"
+    elif code == 12289:
+        return "Supply voltage too low"
+    elif code == 12290:
+        return "Supply voltage too high"
+    elif code == 16385:
+        return "Temperature of electronics is too high"
+    elif code == 16386:
+        return "Temperature of motor winding is too high"
+    elif code == 20481:
+        return "Torque limiting is active"
+    elif code == 24577:
+        return "Locked shaft condition detected"
+    elif code == 28673:
+        return "Regulator error is large"
+    return "Unknown error {}".format(code)
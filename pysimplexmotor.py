@@ -1,43 +1,283 @@
+import asyncio
+import functools
+import warnings
+import weakref
+from types import MappingProxyType
+from typing import NamedTuple
+
 from pymodbus.client.sync import ModbusSerialClient
-from pymodbus.constants import Endian
-from pymodbus.payload import BinaryPayloadDecoder, BinaryPayloadBuilder
 
 from constants import *
 
+# Descriptions of the codes reported in the motor error register
+ERROR_MESSAGES = MappingProxyType({
+    0: "No error",
+    1: "General internal error",
+    2: "Internal software timing error",
+    3: "Error in application: code not terminating",
+    4097: "General communication error",
+    4098: "Invalid register error",
+    4353: "Modbus parity error",
+    4354: "Modbus framing error",
+    4355: "Modbus overrun error",
+    4356: "Modbus checksum error",
+    4357: "Modbus illegal function code error",
+    4358: "Modbus illegal diagnostics function code error",
+    8193: "Hardware overcurrent protection triggered",
+    12289: "Supply voltage too low",
+    12290: "Supply voltage too high",
+    16385: "Temperature of electronics is too high",
+    16386: "Temperature of motor winding is too high",
+    20481: "Torque limiting is active",
+    24577: "Locked shaft condition detected",
+    28673: "Regulator error is large",
+})
+
+
+def decode_error(code):
+    """
+    Describes a code reported in the motor error register
+    :param code: The value of the error register
+    :return: A description of the error
+    """
+    error = ERROR_MESSAGES.get(code)
+    if error is None:
+        error = "Unknown error {}".format(code)
+    return error
+
+
+try:
+    from errorcodes import decode_error as _compiled_decode_error
+except ImportError:
+    pass
+else:
+    # The compiled table is a hand kept copy of ERROR_MESSAGES, so it is only used if it agrees on every code
+    if all(_compiled_decode_error(code) == decode_error(code) for code in (*ERROR_MESSAGES, 0xFFFF)):
+        decode_error = _compiled_decode_error
+    else:
+        warnings.warn('errorcodes does not match ERROR_MESSAGES, rebuild it with cythonize -i errorcodes.pyx. Falling '
+                      'back to the Python decode_error.', RuntimeWarning)
+
+
+class MotorStatus(NamedTuple):
+    """
+    A snapshot of the running data, operating data, and error data of a motor, as returned by get_current_status.
+    Please use the converter class to convert each value into the appropriate unit.
+    """
+    position: int
+    speed: int
+    torque: int
+    voltage: int
+    current: int
+    electronics_temp: int
+    motor_temp: int
+    error: str
+
+    def asdict(self) -> dict:
+        """
+        Converts the status into a dictionary keyed by field name
+        :return: A dictionary containing the current data of the motor
+        """
+        return dict(self._asdict())
+
+
+def _i32_be(registers, offset=0):
+    """
+    Combines two big endian registers into a signed 32 bit integer
+    :param registers: A list of registers holding the high and low registers of the value
+    :param offset: The index of the high register in the list
+    :return: The signed integer held in the registers
+    """
+    value = (registers[offset] << 16) | registers[offset + 1]
+    return value - 0x100000000 if value & 0x80000000 else value
+
+
+def _i16_be(register):
+    """
+    Interprets a single register as a signed 16 bit integer
+    :param register: The raw register value
+    :return: The signed integer held in the register
+    """
+    return register - 0x10000 if register & 0x8000 else register
+
+
+@functools.lru_cache(maxsize=1024)
+def _encode_i32_be(value):
+    """
+    Splits a signed 32 bit integer into its big endian high and low registers. Results are cached, as trajectories
+    tend to send the same targets repeatedly.
+    :param value: The signed integer to encode
+    :return: A tuple of the high and low register values
+    """
+    if not -0x80000000 <= value <= 0x7FFFFFFF:
+        raise ValueError('{} does not fit in a signed 32 bit register pair'.format(value))
+    value &= 0xFFFFFFFF
+    return value >> 16, value & 0xFFFF
+
+
+class ModbusReadError(Exception):
+    """
+    Raised when the motor answers a register read with an error response. The response is kept on the exception, and
+    only formatted into the message when the exception is displayed.
+    """
+
+    def __init__(self, message, response):
+        super().__init__(message, response)
+        self.message = message
+        self.response = response
+
+    def __str__(self):
+        return '{} {}'.format(self.message, self.response)
+
+
+def _check_motor_arguments(identifier, address):
+    """
+    Validates the identifier and address given to a motor. Exact type checks are used, so a bool is not accepted as an
+    address.
+    :param identifier: The identifier of the motor
+    :param address: The modbus address of the motor
+    :raises TypeError: If the identifier is not a str or the address is not an int
+    """
+    if type(identifier) is not str:
+        raise TypeError('identifier must be a str, not {}'.format(type(identifier).__name__))
+    if type(address) is not int:
+        raise TypeError('address must be an int, not {}'.format(type(address).__name__))
+
+
+def _merge_adjacent_writes(writes):
+    """
+    Merges consecutive register writes whose addresses follow on from each other, keeping the order of the writes
+    :param writes: A list of (address, register values) tuples
+    :return: A list of (address, register values) tuples, with adjacent writes combined
+    """
+    merged = []
+    for address, values in writes:
+        if merged and merged[-1][0] + len(merged[-1][1]) == address:
+            merged[-1][1].extend(values)
+        else:
+            merged.append((address, list(values)))
+    return merged
+
+
+def _motion_writes(mode, max_speed, max_acc, target):
+    """
+    Lays out the register writes used to start a motion, in the order they are sent to the motor
+    :param mode: Operating mode to write, or None to leave the mode untouched
+    :param max_speed: Maximum speed in SMunits to write, or None to leave it untouched
+    :param max_acc: Maximum acceleration in SMunits to write, or None to leave it untouched
+    :param target: Target to write, or None to leave it untouched
+    :return: A list of (address, register values) tuples, with adjacent writes combined
+    """
+    writes = []
+    if mode is not None:
+        writes.append((MODE, [mode]))
+    if max_speed is not None:
+        writes.append((MOTOR_MAX_SPEED, [max_speed]))
+    if max_acc is not None:
+        writes.append((MOTOR_MAX_ACCELERATION, [max_acc]))
+    if target is not None:
+        writes.append((SET_MOTOR_TARGET, _encode_i32_be(target)))
+    return _merge_adjacent_writes(writes)
+
+
+def _mode_to_write(read_mode, mode):
+    """
+    Decides whether a motion has to switch the motor into its mode first
+    :param read_mode: The mode the motor is currently in
+    :param mode: The mode the motion runs in
+    :return: The mode to write, or None when the motor is already in it and only the motion registers are written
+    """
+    return None if read_mode == mode else mode
+
+
+def _check_reset(reset):
+    """
+    Checks the motor was reset before it is switched into a new mode
+    :param reset: Boolean returned by reset_motor
+    :raises Exception: If the reset failed
+    """
+    if not reset:
+        raise Exception('Unable to reset motor. {}'.format(reset))
+
 
 class PySimplexMotor(object):
 
+    __slots__ = ('identifier', 'address', '_modbus_client', '_mode_cache', '_read', '_write', '_write_many')
+
+    # Register spans polled by get_current_status, as (start, count). The running data registers (position through
+    # torque current) sit close enough together to be fetched in a single request, well inside the 125 register limit
+    # of a Modbus read, the temperatures form a second run and the error register a third.
+    _STATUS_RUNNING_SPAN = (MOTOR_POS, TORQUE_CURRENT - MOTOR_POS + 1)
+    _STATUS_OPERATING_SPAN = (TEMP_ELECTRONICS, TEMP_MOTOR - TEMP_ELECTRONICS + 1)
+    _POS_OFFSET = MOTOR_POS - MOTOR_POS
+    _SPEED_OFFSET = MOTOR_SPEED - MOTOR_POS
+    _TORQUE_OFFSET = MOTOR_TORQUE - MOTOR_POS
+    _VOLTAGE_OFFSET = MOTOR_VOLTAGE - MOTOR_POS
+    _CURRENT_OFFSET = TORQUE_CURRENT - MOTOR_POS
+    _ELECTRONICS_TEMP_OFFSET = TEMP_ELECTRONICS - TEMP_ELECTRONICS
+    _MOTOR_TEMP_OFFSET = TEMP_MOTOR - TEMP_ELECTRONICS
+
     def __init__(self, identifier, address, modbus_client):
         """
         Initializes a new motor with a unique identifier, modbus address, and modbus client.
         :param identifier: An identifier to recognize your specific motor.
         :param address: The modbus address of your motor, set using the SimplexMotion tool.
         :param modbus_client: The Pymodbus client designed to communicate with SimplexMotion motors over modbus.
+        :raises TypeError: If any of the arguments has the wrong type
+        """
+        _check_motor_arguments(identifier, address)
+        if not isinstance(modbus_client, ModbusSerialClient):
+            raise TypeError('modbus_client must be a ModbusSerialClient, not {}'.format(type(modbus_client).__name__))
+        self._setup(identifier, address, modbus_client)
+
+    def _setup(self, identifier, address, modbus_client):
+        """
+        Sets the state shared by the sync and async motors, once the arguments have been validated
+        :param identifier: An identifier to recognize your specific motor.
+        :param address: The modbus address of your motor.
+        :param modbus_client: The modbus client used to communicate with the motor.
         """
         self.identifier = identifier
         self.address = address
         self.modbus_client = modbus_client
-        assert isinstance(identifier, str) and isinstance(address, int) and isinstance(modbus_client, ModbusSerialClient)
+
+    @property
+    def modbus_client(self):
+        """
+        The modbus client used to communicate with the motor. Assigning a new client, for example after reconnecting,
+        rebinds every request of the motor to it and forgets the cached mode.
+        """
+        return self._modbus_client
+
+    @modbus_client.setter
+    def modbus_client(self, modbus_client):
+        self._modbus_client = modbus_client
+        # Bound once, as every getter and setter goes through these
+        self._read = modbus_client.read_holding_registers
+        self._write = modbus_client.write_register
+        self._write_many = modbus_client.write_registers
+        # Last mode written to the motor by this instance, or None when it has to be read back from the motor. A new
+        # client may reach a motor that was reset or reconfigured meanwhile, so the mode is read back again
+        self._mode_cache = None
 
     def get_position(self) -> int:
         """
         Gets the current position of the motor. This is found in the current position register.
         :return: An integer value for the current position of the motor
         """
-        pos_response = self.modbus_client.read_holding_registers(MOTOR_POS, 2, unit=self.address)
+        pos_response = self._read(MOTOR_POS, 2, unit=self.address)
         if pos_response.isError():
-            raise Exception('Unable to retrieve current position. {}'.format(pos_response))
-        decoder = BinaryPayloadDecoder.fromRegisters(pos_response.registers, byteorder=Endian.Big, wordorder=Endian.Big)
-        return decoder.decode_32bit_int()
+            raise ModbusReadError('Unable to retrieve current position.', pos_response)
+        return _i32_be(pos_response.registers)
 
     def get_speed(self) -> int:
         """
         Gets the current speed of the motor. This is found in the motors speed register.
         :return: An integer value for the current speed of the motor
         """
-        speed_response = self.modbus_client.read_holding_registers(MOTOR_SPEED, 1, unit=self.address)
+        speed_response = self._read(MOTOR_SPEED, 1, unit=self.address)
         if speed_response.isError():
-            raise Exception('Unable to retrieve current speed. {}'.format(speed_response))
+            raise ModbusReadError('Unable to retrieve current speed.', speed_response)
         return speed_response.registers[0]
 
     def get_torque(self):
@@ -45,9 +285,9 @@ class PySimplexMotor(object):
         Gets the current torque of the motor. This is found in the motors torque register.
         :return: An integer value for the current torque of the motor
         """
-        torque_response = self.modbus_client.read_holding_registers(MOTOR_TORQUE, 1, unit=self.address)
+        torque_response = self._read(MOTOR_TORQUE, 1, unit=self.address)
         if torque_response.isError():
-            raise Exception('Unable to retrieve current torque. {}'.format(torque_response))
+            raise ModbusReadError('Unable to retrieve current torque.', torque_response)
         return torque_response.registers[0]
 
     def get_acceleration(self):
@@ -55,9 +295,9 @@ class PySimplexMotor(object):
         Gets the current acceleration of the motor. This is found in the motor max acceleration register.
         :return: An integer value for the maximum acceleration of the motor
         """
-        acc_response = self.modbus_client.read_holding_registers(MOTOR_RAMP_ACC, 1, unit=self.address)
+        acc_response = self._read(MOTOR_RAMP_ACC, 1, unit=self.address)
         if acc_response.isError():
-            raise Exception('Unable to retrieve current acceleration. {}'.format(acc_response))
+            raise ModbusReadError('Unable to retrieve current acceleration.', acc_response)
         return acc_response.registers[0]
 
     def get_current_target(self):
@@ -65,20 +305,19 @@ class PySimplexMotor(object):
         Gets the current target input on the target register.
         :return: An integer value for the current target input to the motor target register
         """
-        target_response = self.modbus_client.read_holding_registers(SET_MOTOR_TARGET, 2, unit=self.address)
+        target_response = self._read(SET_MOTOR_TARGET, 2, unit=self.address)
         if target_response.isError():
-            raise Exception('Unable to retrieve current target. {}'.format(target_response))
-        decoder = BinaryPayloadDecoder.fromRegisters(target_response.registers, byteorder=Endian.Big, wordorder=Endian.Big)
-        return decoder.decode_32bit_int()
+            raise ModbusReadError('Unable to retrieve current target.', target_response)
+        return _i32_be(target_response.registers)
 
     def get_max_speed(self):
         """
         Gets the maximum speed cap on the motor.
         :return: An integer value for the maximum speed cap set on the motor
         """
-        speed_response = self.modbus_client.read_holding_registers(MOTOR_MAX_SPEED, 1, unit=self.address)
+        speed_response = self._read(MOTOR_MAX_SPEED, 1, unit=self.address)
         if speed_response.isError():
-            raise Exception('Unable to retrieve max speed. {}'.format(speed_response))
+            raise ModbusReadError('Unable to retrieve max speed.', speed_response)
         return speed_response.registers[0]
 
     def get_max_torque(self):
@@ -86,9 +325,9 @@ class PySimplexMotor(object):
         Gets the maximum torque cap on the motor
         :return: An integer value for the maximum torque cap set on the motor
         """
-        torque_response = self.modbus_client.read_holding_registers(MOTOR_MAX_TORQUE, 1, unit=self.address)
+        torque_response = self._read(MOTOR_MAX_TORQUE, 1, unit=self.address)
         if torque_response.isError():
-            raise Exception('Unable to retrieve current torque. {}'.format(torque_response))
+            raise ModbusReadError('Unable to retrieve current torque.', torque_response)
         return torque_response.registers[0]
 
     def get_max_acceleration(self):
@@ -96,9 +335,9 @@ class PySimplexMotor(object):
         Gets the maximum acceleration cap on the motor
         :return: An integer value for the maximum acceleration cap set on the motor
         """
-        acc_response = self.modbus_client.read_holding_registers(MOTOR_MAX_ACCELERATION, 1, unit=self.address)
+        acc_response = self._read(MOTOR_MAX_ACCELERATION, 1, unit=self.address)
         if acc_response.isError():
-            raise Exception('Unable to retrieve max acceleration. {}'.format(acc_response))
+            raise ModbusReadError('Unable to retrieve max acceleration.', acc_response)
         return acc_response.registers[0]
 
     def get_mode(self):
@@ -106,27 +345,21 @@ class PySimplexMotor(object):
         Gets the current mode setting of the motor
         :return: An integer describing the various modes of operation for the motor
         """
-        mode = self.modbus_client.read_holding_registers(MODE, 1, unit=self.address)
+        mode = self._read(MODE, 1, unit=self.address)
         if mode.isError():
-            raise Exception('Unable to retrieve current mode. {}'.format(mode))
-        return mode.registers[0]
+            raise ModbusReadError('Unable to retrieve current mode.', mode)
+        self._mode_cache = mode.registers[0]
+        return self._mode_cache
 
     def go_with_speed(self, speed_units, acc_units):
         """
         Rotates the motor with a target speed, and acceleration
         :param speed_units: Units of speed measured in SMUnits. Please use the converter class to convert from RPM.
         :param acc_units: Units of acceleration measured in SMUnits. Please use the converter class to convert from RPM/s
-        :return:
-        """
-        # Check if speed mode, else set to speed and reset target
-        read_mode = self.get_mode()
-        if read_mode != 33:
-            reset = self.reset_motor()
-            if not reset:
-                raise Exception('Unable to reset motor. {}'.format(reset))
-            self.set_mode(33)
-        self.set_max_acceleration(acc_units)
-        return self.set_target(speed_units)
+        :return: Boolean indicating if every write was successful
+        """
+        # Speed mode, the speed is written to the target register
+        return self._go(33, None, acc_units, speed_units)
 
     def go_to_position(self, steps, speed_units, acc_units):
         """
@@ -134,18 +367,60 @@ class PySimplexMotor(object):
         :param steps: Units of position measured in steps. Please use the converter class to convert from steps to meters.
         :param speed_units: Units of speed measured in SMUnits. Please use the converter class to convert from RPM.
         :param acc_units: Units of acceleration measured in SMUnits. Please use the converter class to convert from RPM/s
-        :return:
-        """
-        # Check if position mode, else set to position and reset target
-        read_mode = self.get_mode()
-        if read_mode != 21:
-            reset = self.reset_motor()
-            if not reset:
-                raise Exception('Unable to reset motor. {}'.format(reset))
-            self.set_mode(21)
-        self.set_max_speed(speed_units)
-        self.set_max_acceleration(acc_units)
-        return self.set_target(steps)
+        :return: Boolean indicating if every write was successful
+        """
+        # Position mode, the position is written to the target register
+        return self._go(21, speed_units, acc_units, steps)
+
+    def _go(self, mode, max_speed, max_acc, target) -> bool:
+        """
+        Starts a motion in the given mode. If the motor is not already in that mode it is reset, and the mode is written
+        along with the motion registers.
+        :param mode: The mode the motion runs in
+        :param max_speed: Maximum speed in SMunits to write, or None to leave it untouched
+        :param max_acc: Maximum acceleration in SMunits to write, or None to leave it untouched
+        :param target: Target to write
+        :return: Boolean indicating if every write was successful
+        """
+        read_mode = self._mode_cache if self._mode_cache is not None else self.get_mode()
+        mode = _mode_to_write(read_mode, mode)
+        if mode is not None:
+            _check_reset(self.reset_motor())
+        return self._bulk_configure(mode, max_speed, max_acc, target)
+
+    def _bulk_configure(self, mode, max_speed, max_acc, target) -> bool:
+        """
+        Writes the registers used to start a motion, in order. Writes to neighbouring registers are merged into a single
+        multi register write, so each run of adjacent registers costs one Modbus transaction.
+        :param mode: Operating mode to write, or None to leave the mode untouched
+        :param max_speed: Maximum speed in SMunits to write, or None to leave it untouched
+        :param max_acc: Maximum acceleration in SMunits to write, or None to leave it untouched
+        :param target: Target to write, or None to leave it untouched
+        :return: Boolean indicating if every write was successful
+        """
+        responses = [request(*args, unit=self.address)
+                     for request, args in self._motion_requests(mode, max_speed, max_acc, target)]
+        return self._record_motion(mode, responses)
+
+    def _motion_requests(self, mode, max_speed, max_acc, target):
+        """
+        Pairs each write of a motion with the client request that sends it
+        :return: A list of (request, arguments) tuples, in the order they are sent to the motor
+        """
+        return [(self._write, (address, values[0])) if len(values) == 1 else (self._write_many, (address, values))
+                for address, values in _motion_writes(mode, max_speed, max_acc, target)]
+
+    def _record_motion(self, mode, responses) -> bool:
+        """
+        Checks the responses to the writes of a motion, and records the mode if one was written
+        :param mode: The mode that was written, or None if the mode was left untouched
+        :param responses: The responses to every write of the motion
+        :return: Boolean indicating if every write was successful
+        """
+        success = all(not response.isError() for response in responses)
+        if mode is not None:
+            self._mode_cache = mode if success else None
+        return success
 
     def set_max_speed(self, sm_units) -> bool:
         """
@@ -153,7 +428,7 @@ class PySimplexMotor(object):
         :param sm_units: Units of speed measured in SMunits. Please use the converter class to convert from RPM to steps.
         :return: Boolean indicating if the write was successful
         """
-        write_response = self.modbus_client.write_register(MOTOR_MAX_SPEED, sm_units, unit=self.address)
+        write_response = self._write(MOTOR_MAX_SPEED, sm_units, unit=self.address)
         return not write_response.isError()
 
     def set_max_torque(self, torque) -> bool:
@@ -162,7 +437,7 @@ class PySimplexMotor(object):
         :param torque: Units of torque measured in mNm
         :return: Boolean indicating if the write was successful
         """
-        write_response = self.modbus_client.write_register(MOTOR_MAX_TORQUE, torque, unit=self.address)
+        write_response = self._write(MOTOR_MAX_TORQUE, torque, unit=self.address)
         return not write_response.isError()
 
     def set_max_acceleration(self, steps):
@@ -171,7 +446,7 @@ class PySimplexMotor(object):
         :param steps: Units of acceleration measured in SMunits. Please use the converter class to convert from RPM/s to steps.
         :return: Boolean indicating if the write was successful
         """
-        write_response = self.modbus_client.write_register(MOTOR_MAX_ACCELERATION, steps, unit=self.address)
+        write_response = self._write(MOTOR_MAX_ACCELERATION, steps, unit=self.address)
         return not write_response.isError()
 
     def set_max_deceleration(self, steps):
@@ -180,7 +455,7 @@ class PySimplexMotor(object):
         :param steps: Units of acceleration measured in SMunits. Please use the converter class to convert from RPM/s to steps.
         :return: Boolean indicating if the write was successful
         """
-        write_response = self.modbus_client.write_register(MOTOR_MAX_DECELERATION, steps, unit=self.address)
+        write_response = self._write(MOTOR_MAX_DECELERATION, steps, unit=self.address)
         return not write_response.isError()
 
     def set_mode(self, mode):
@@ -189,8 +464,8 @@ class PySimplexMotor(object):
         :param mode: Integer indicating the intended operating mode. Consult the simplexmotion manual for details
         :return: Boolean indicating if the write was successful
         """
-        write_response = self.modbus_client.write_register(MODE, mode, unit=self.address)
-        return not write_response.isError()
+        write_response = self._write(MODE, mode, unit=self.address)
+        return self._update_mode_cache(mode, write_response)
 
     def set_target(self, target):
         """
@@ -198,100 +473,317 @@ class PySimplexMotor(object):
         :param target: Units of acceleration measured in SMunits. Please use the converter class to convert from desired units to steps.
         :return: Boolean indicating if the write was successful
         """
-        builder = BinaryPayloadBuilder(byteorder=Endian.Big, wordorder=Endian.Big)
-        builder.add_32bit_int(target)
-        request = self.modbus_client.write_registers(SET_MOTOR_TARGET, builder.to_registers(), unit=self.address)
-        return not request.isError()
+        return self._bulk_configure(None, None, None, target)
 
     def reset_motor(self):
         """
         Resets the motor
         :return: Boolean indicating if the write was successful
         """
-        write_response = self.modbus_client.write_register(MODE, 1, unit=self.address)
-        return not write_response.isError()
+        write_response = self._write(MODE, 1, unit=self.address)
+        return self._update_mode_cache(1, write_response)
 
     def stop_motor(self):
         """
         Stops the motor
         :return: Boolean indicating if the write was successful
         """
-        write_response = self.modbus_client.write_register(MODE, 5, unit=self.address)
-        return not write_response.isError()
+        write_response = self._write(MODE, 5, unit=self.address)
+        return self._update_mode_cache(5, write_response)
+
+    def invalidate_mode_cache(self):
+        """
+        Forgets the last mode written to the motor, so the next go_* call reads the mode back from the motor. Call this
+        whenever the mode may have been changed by something other than this instance.
+        """
+        self._mode_cache = None
 
-    def get_current_status(self):
+    def _update_mode_cache(self, mode, write_response) -> bool:
+        """
+        Records the mode written to the motor if the write succeeded, and forgets it otherwise
+        :param mode: The mode that was written to the mode register
+        :param write_response: The response to the mode register write
+        :return: Boolean indicating if the write was successful
+        """
+        success = not write_response.isError()
+        self._mode_cache = mode if success else None
+        return success
+
+    def get_current_status(self) -> MotorStatus:
         """
         Gets the current status of the motor, including running data, operating data, and error data.
-        :return: A dictionary containing the current data of the motor. Please use the converter class to convert each value into the appropriate unit.
-        """
-        motor_running_data = self.modbus_client.read_holding_registers(MOTOR_POS, 4, unit=self.address)
-        motor_voltage_data = self.modbus_client.read_holding_registers(MOTOR_VOLTAGE, 1, unit=self.address)
-        motor_current_data = self.modbus_client.read_holding_registers(TORQUE_CURRENT, 1, unit=self.address)
-        motor_operating_data = self.modbus_client.read_holding_registers(TEMP_ELECTRONICS, 2, unit=self.address)
-        motor_error_data = self.modbus_client.read_holding_registers(ERROR, 1, unit=self.address)
-        if motor_running_data.isError() or motor_error_data.isError() or motor_voltage_data.isError() or motor_current_data.isError() or motor_operating_data.isError():
-            raise Exception('Unable to get motor data. {}'.format(motor_running_data, motor_operating_data, motor_current_data, motor_voltage_data, motor_error_data))
-        decoder = BinaryPayloadDecoder.fromRegisters(motor_running_data.registers[0:2], byteorder=Endian.Big,
-                                                     wordorder=Endian.Big)
-        decoder2 = BinaryPayloadDecoder.fromRegisters(motor_voltage_data.registers, byteorder=Endian.Big,
-                                                     wordorder=Endian.Big)
-        decoder3 = BinaryPayloadDecoder.fromRegisters(motor_current_data.registers, byteorder=Endian.Big,
-                                                     wordorder=Endian.Big)
-        decoder4 = BinaryPayloadDecoder.fromRegisters(motor_running_data.registers[3:4], byteorder=Endian.Big,
-                                                      wordorder=Endian.Big)
-        error = motor_error_data.registers[0]
-
-        if error == 0:
-            error = "No error"
-        if error == 1:
-            error = "General internal error"
-        if error == 2:
-            error = "Internal software timing error"
-        if error == 3:
-            error = "Error in application: code not terminating"
-        if error == 4097:
-            error = "General communication error"
-        if error == 4098:
-            error = "Invalid register error"
-        if error == 4353:
-            error = "Modbus parity error"
-        if error == 4354:
-            error = "Modbus framing error"
-        if error == 4355:
-            error = "Modbus overrun error"
-        if error == 4356:
-            error = "Modbus checksum error"
-        if error == 4357:
-            error = "Modbus illegal function code error"
-        if error == 4358:
-            error = "Modbus illegal diagnostics function code error"
-        if error == 8193:
-            error = "Hardware overcurrent protection triggered"
-        if error == 12289:
-            error = "Supply voltage too low"
-        if error == 12290:
-            error = "Supply voltage too high"
-        if error == 16385:
-            error = "Temperature of electronics is too high"
-        if error == 16386:
-            error = "Temperature of motor winding is too high"
-        if error == 20481:
-            error = "Torque limiting is active"
-        if error == 24577:
-            error = "Locked shaft condition detected"
-        if error == 28673:
-            error = "Regulator error is large"
+        :return: A MotorStatus containing the current data of the motor. Please use the converter class to convert each value into the appropriate unit.
+        """
+        running_start, running_count = self._STATUS_RUNNING_SPAN
+        operating_start, operating_count = self._STATUS_OPERATING_SPAN
+        motor_running_data = self._read(running_start, running_count, unit=self.address)
+        motor_operating_data = self._read(operating_start, operating_count, unit=self.address)
+        motor_error_data = self._read(ERROR, 1, unit=self.address)
+        for response in (motor_running_data, motor_operating_data, motor_error_data):
+            if response.isError():
+                raise ModbusReadError('Unable to get motor data.', response)
+        return self._decode_status(motor_running_data.registers, motor_operating_data.registers,
+                                   motor_error_data.registers[0])
+
+    def _decode_status(self, running, operating, error_code) -> MotorStatus:
+        """
+        Decodes the registers read by get_current_status
+        :param running: The registers of the running data span
+        :param operating: The registers of the operating data span
+        :param error_code: The value of the error register
+        :return: A MotorStatus containing the decoded data of the motor
+        """
+        error = decode_error(error_code)
 
         # TIP: You can get true current drawn by the motor, by multiplying the torque value, and it's corresponding
         # speed.
-        return {
-            "position": decoder.decode_32bit_int(),
-            "speed": motor_running_data.registers[2],
-            "torque": decoder4.decode_16bit_int(),
-            "voltage": decoder2.decode_16bit_int(),
-            "current": decoder3.decode_16bit_int(),
-            "electronics_temp": motor_operating_data.registers[0],
-            "motor_temp": motor_operating_data.registers[1],
-            "error": error
-        }
+        return MotorStatus(
+            position=_i32_be(running, self._POS_OFFSET),
+            speed=running[self._SPEED_OFFSET],
+            torque=_i16_be(running[self._TORQUE_OFFSET]),
+            voltage=_i16_be(running[self._VOLTAGE_OFFSET]),
+            current=_i16_be(running[self._CURRENT_OFFSET]),
+            electronics_temp=operating[self._ELECTRONICS_TEMP_OFFSET],
+            motor_temp=operating[self._MOTOR_TEMP_OFFSET],
+            error=error
+        )
+
+
+# The event loop and lock serialising the requests of every AsyncPySimplexMotor sharing a modbus client
+_client_locks = weakref.WeakKeyDictionary()
+
+
+def _client_lock(modbus_client):
+    """
+    Gets the lock serialising requests on a modbus client. Locks are created on first use inside the running event loop,
+    and replaced when the client is used from a new event loop, as asyncio locks cannot be shared between loops.
+    :param modbus_client: The asyncio modbus client requests are sent through
+    :return: The asyncio.Lock of the client for the running event loop
+    """
+    loop = asyncio.get_running_loop()
+    loop_and_lock = _client_locks.get(modbus_client)
+    if loop_and_lock is None or loop_and_lock[0] is not loop:
+        loop_and_lock = _client_locks[modbus_client] = (loop, asyncio.Lock())
+    return loop_and_lock[1]
+
+
+class AsyncPySimplexMotor(PySimplexMotor):
+    """
+    A motor whose getters and setters are coroutines. go_with_speed, go_to_position and set_target are shared with
+    PySimplexMotor and return awaitables here, as the motion writes they delegate to are coroutines.
+    """
+
+    __slots__ = ('_serialize',)
+
+    def __init__(self, identifier, address, modbus_client, serialize=True):
+        """
+        Initializes a new motor driven through an asyncio modbus client, such as the protocol of a pymodbus
+        AsyncModbusSerialClient or AsyncModbusTcpClient created with the asyncio scheduler.
+        :param identifier: An identifier to recognize your specific motor.
+        :param address: The modbus address of your motor, set using the SimplexMotion tool.
+        :param modbus_client: The asyncio modbus client whose requests return awaitable responses.
+        :param serialize: Whether requests must wait for any other request on the same client to complete. Keep this
+        enabled for Modbus RTU, where only one transaction can be on the bus at a time. Modbus TCP clients may disable
+        it to keep several transactions in flight.
+        :raises TypeError: If the identifier or address has the wrong type
+        """
+        _check_motor_arguments(identifier, address)
+        self._setup(identifier, address, modbus_client)
+        self._serialize = serialize
+
+    async def _request(self, request, *args):
+        """
+        Sends a single request to the motor, waiting for the bus if requests on this client are serialised
+        :param request: The modbus client method sending the request
+        :param args: The address and values of the request
+        :return: The response of the motor
+        """
+        if not self._serialize:
+            return await request(*args, unit=self.address)
+        async with _client_lock(self.modbus_client):
+            return await request(*args, unit=self.address)
+
+    async def _read_registers(self, address, count, description):
+        """
+        Reads a span of holding registers from the motor
+        :param address: The address of the first register
+        :param count: The number of registers to read
+        :param description: A description of the value, used in the error raised when the read fails
+        :return: The list of register values
+        """
+        response = await self._request(self._read, address, count)
+        if response.isError():
+            raise ModbusReadError('Unable to retrieve {}.'.format(description), response)
+        return response.registers
+
+    async def _write_register(self, address, value) -> bool:
+        """
+        Writes a single holding register of the motor
+        :param address: The address of the register
+        :param value: The value to write
+        :return: Boolean indicating if the write was successful
+        """
+        write_response = await self._request(self._write, address, value)
+        return not write_response.isError()
+
+    async def get_position(self) -> int:
+        """
+        Gets the current position of the motor. This is found in the current position register.
+        :return: An integer value for the current position of the motor
+        """
+        return _i32_be(await self._read_registers(MOTOR_POS, 2, 'current position'))
+
+    async def get_speed(self) -> int:
+        """
+        Gets the current speed of the motor. This is found in the motors speed register.
+        :return: An integer value for the current speed of the motor
+        """
+        return (await self._read_registers(MOTOR_SPEED, 1, 'current speed'))[0]
+
+    async def get_torque(self):
+        """
+        Gets the current torque of the motor. This is found in the motors torque register.
+        :return: An integer value for the current torque of the motor
+        """
+        return (await self._read_registers(MOTOR_TORQUE, 1, 'current torque'))[0]
+
+    async def get_acceleration(self):
+        """
+        Gets the current acceleration of the motor. This is found in the motor max acceleration register.
+        :return: An integer value for the maximum acceleration of the motor
+        """
+        return (await self._read_registers(MOTOR_RAMP_ACC, 1, 'current acceleration'))[0]
+
+    async def get_current_target(self):
+        """
+        Gets the current target input on the target register.
+        :return: An integer value for the current target input to the motor target register
+        """
+        return _i32_be(await self._read_registers(SET_MOTOR_TARGET, 2, 'current target'))
+
+    async def get_max_speed(self):
+        """
+        Gets the maximum speed cap on the motor.
+        :return: An integer value for the maximum speed cap set on the motor
+        """
+        return (await self._read_registers(MOTOR_MAX_SPEED, 1, 'max speed'))[0]
+
+    async def get_max_torque(self):
+        """
+        Gets the maximum torque cap on the motor
+        :return: An integer value for the maximum torque cap set on the motor
+        """
+        return (await self._read_registers(MOTOR_MAX_TORQUE, 1, 'max torque'))[0]
+
+    async def get_max_acceleration(self):
+        """
+        Gets the maximum acceleration cap on the motor
+        :return: An integer value for the maximum acceleration cap set on the motor
+        """
+        return (await self._read_registers(MOTOR_MAX_ACCELERATION, 1, 'max acceleration'))[0]
+
+    async def get_mode(self):
+        """
+        Gets the current mode setting of the motor
+        :return: An integer describing the various modes of operation for the motor
+        """
+        self._mode_cache = (await self._read_registers(MODE, 1, 'current mode'))[0]
+        return self._mode_cache
+
+    async def _go(self, mode, max_speed, max_acc, target) -> bool:
+        """
+        Starts a motion in the given mode, see PySimplexMotor._go
+        """
+        read_mode = self._mode_cache if self._mode_cache is not None else await self.get_mode()
+        mode = _mode_to_write(read_mode, mode)
+        if mode is not None:
+            _check_reset(await self.reset_motor())
+        return await self._bulk_configure(mode, max_speed, max_acc, target)
+
+    async def _bulk_configure(self, mode, max_speed, max_acc, target) -> bool:
+        """
+        Writes the registers used to start a motion, see PySimplexMotor._bulk_configure
+        """
+        responses = [await self._request(request, *args)
+                     for request, args in self._motion_requests(mode, max_speed, max_acc, target)]
+        return self._record_motion(mode, responses)
+
+    async def set_max_speed(self, sm_units) -> bool:
+        """
+        Sets the maximum speed for a motor
+        :param sm_units: Units of speed measured in SMunits. Please use the converter class to convert from RPM to steps.
+        :return: Boolean indicating if the write was successful
+        """
+        return await self._write_register(MOTOR_MAX_SPEED, sm_units)
+
+    async def set_max_torque(self, torque) -> bool:
+        """
+        Sets the maximum torque for the motor
+        :param torque: Units of torque measured in mNm
+        :return: Boolean indicating if the write was successful
+        """
+        return await self._write_register(MOTOR_MAX_TORQUE, torque)
+
+    async def set_max_acceleration(self, steps):
+        """
+        Sets the maximum acceleration for the motor
+        :param steps: Units of acceleration measured in SMunits. Please use the converter class to convert from RPM/s to steps.
+        :return: Boolean indicating if the write was successful
+        """
+        return await self._write_register(MOTOR_MAX_ACCELERATION, steps)
+
+    async def set_max_deceleration(self, steps):
+        """
+        Sets the maximum deceleration for the motor
+        :param steps: Units of acceleration measured in SMunits. Please use the converter class to convert from RPM/s to steps.
+        :return: Boolean indicating if the write was successful
+        """
+        return await self._write_register(MOTOR_MAX_DECELERATION, steps)
+
+    async def set_mode(self, mode):
+        """
+        Sets the motor operating mode
+        :param mode: Integer indicating the intended operating mode. Consult the simplexmotion manual for details
+        :return: Boolean indicating if the write was successful
+        """
+        write_response = await self._request(self._write, MODE, mode)
+        return self._update_mode_cache(mode, write_response)
+
+    async def reset_motor(self):
+        """
+        Resets the motor
+        :return: Boolean indicating if the write was successful
+        """
+        write_response = await self._request(self._write, MODE, 1)
+        return self._update_mode_cache(1, write_response)
+
+    async def stop_motor(self):
+        """
+        Stops the motor
+        :return: Boolean indicating if the write was successful
+        """
+        write_response = await self._request(self._write, MODE, 5)
+        return self._update_mode_cache(5, write_response)
+
+    async def get_current_status(self) -> MotorStatus:
+        """
+        Gets the current status of the motor, including running data, operating data, and error data.
+        :return: A MotorStatus containing the current data of the motor. Please use the converter class to convert each value into the appropriate unit.
+        """
+        running_start, running_count = self._STATUS_RUNNING_SPAN
+        operating_start, operating_count = self._STATUS_OPERATING_SPAN
+        running, operating, error = await asyncio.gather(
+            self._read_registers(running_start, running_count, 'motor running data'),
+            self._read_registers(operating_start, operating_count, 'motor operating data'),
+            self._read_registers(ERROR, 1, 'motor error data'))
+        return self._decode_status(running, operating, error[0])
+
 
+async def gather_current_status(motors):
+    """
+    Polls the status of several motors concurrently. Motors on different clients, or on a client with serialisation
+    disabled, have their requests in flight at the same time.
+    :param motors: An iterable of AsyncPySimplexMotor instances
+    :return: A list of MotorStatus, in the same order as the motors
+    """
+    return list(await asyncio.gather(*[motor.get_current_status() for motor in motors]))